@@ -184,9 +184,9 @@ def render_section_3():
 
         # Handle coordinate validation
         lat, lon = parse_coordinates(str(latitude), longitude)
-        is_valid, error_msg = validate_coordinates(lat, lon)
+        error_msg = validate_coordinates(lat, lon)
 
-        if not is_valid and error_msg:
+        if error_msg:
             st.error(error_msg)
         else:
             st.session_state.form_data["latitude"] = lat
@@ -293,6 +293,7 @@ CLUSTERING_DISTANCE_THRESHOLD = 0.01  # Degrees for map clustering
 # Database-specific settings
 MATERIALIZED_VIEW_REFRESH_INTERVAL = 3600  # Seconds (1 hour)
 MAX_QUERY_RESULTS = 10000  # Maximum results per query
+MIGRATION_BATCH_SIZE = 10000  # Rows per bulk insert batch during SQLite migration
 DEFAULT_PAGINATION_SIZE = 20
 
 # Enhanced typology codes for PostgreSQL schema
@@ -325,7 +325,7 @@ class AtlasDBAdapter(DatabaseInterface):
         projects = self.get_projects_by_filters(**(filters or {}))
 
         import pandas as pd
-        from src.utils import export_to_csv, export_to_xlsx
+        from src.utils import export_to_csv, export_to_xlsx, export_to_parquet, export_to_feather
 
         df = pd.DataFrame(projects)
 
@@ -333,6 +333,10 @@ class AtlasDBAdapter(DatabaseInterface):
             return export_to_csv(df)
         elif format.lower() in ["xlsx", "excel"]:
             return export_to_xlsx(df)
+        elif format.lower() == "parquet":
+            return export_to_parquet(df)
+        elif format.lower() == "feather":
+            return export_to_feather(df)
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
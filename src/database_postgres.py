@@ -22,7 +22,9 @@ from src.database_interface import DatabaseInterface
 from src.models_postgres import (
     Base, Project, User, UiaRegion, Sdg, ProjectSdg, ProjectTypology,
     ProjectRequirement, ProjectImage, ProjectWorkflowHistory, Review,
-    Typology, Requirement, MvFundingByRegion, MvSdgDistribution
+    Typology, Requirement, MvFundingByRegion, MvSdgDistribution,
+    PROJECT_LIST_LOAD_OPTIONS, PROJECT_DETAIL_LOAD_OPTIONS, EMAIL_ADDRESS_DOMAIN,
+    STORAGE_PARAMETER_MIN_SERVER_VERSION, TAG_ARRAY_TRIGGERS
 )
 from src.constants import (
     PROJECT_STATUS_ENUM_VALUES, WORKFLOW_STATUS_ENUM_VALUES,
@@ -52,7 +54,11 @@ class AtlasPostgreSQLDB(DatabaseInterface):
                 max_overflow=self.config.database.max_overflow,
                 echo=self.config.database.echo,
                 pool_pre_ping=True,  # Verify connections before use
-                pool_recycle=3600    # Recycle connections every hour
+                pool_recycle=3600,   # Recycle connections every hour
+                # psycopg2 fast execution helpers for executemany() INSERT/UPDATE
+                executemany_mode='values_plus_batch',
+                executemany_batch_page_size=500,
+                insertmanyvalues_page_size=10000
             )
 
             self.SessionLocal = sessionmaker(
@@ -71,13 +77,26 @@ class AtlasPostgreSQLDB(DatabaseInterface):
     def _initialize_schema(self):
         """Initialize database schema and reference data"""
         try:
-            # Create all tables
-            Base.metadata.create_all(bind=self.engine)
-
-            # Create extensions if they don't exist
+            # Create extensions if they don't exist (tables depend on their types and operator classes)
             with self.engine.connect() as conn:
                 conn.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"'))
                 conn.execute(text('CREATE EXTENSION IF NOT EXISTS "postgis"'))
+                conn.execute(text('CREATE EXTENSION IF NOT EXISTS "pg_trgm"'))
+                conn.execute(text('CREATE EXTENSION IF NOT EXISTS "citext"'))
+                conn.execute(text(EMAIL_ADDRESS_DOMAIN))
+                conn.commit()
+
+            # Create all tables (materialized views are created separately below)
+            tables = [table for table in Base.metadata.sorted_tables if not table.info.get('is_view')]
+            Base.metadata.create_all(bind=self.engine, tables=tables)
+
+            # Per-table fillfactor/autovacuum settings (not expressible in CREATE TABLE via SQLAlchemy)
+            self._apply_storage_parameters(tables)
+
+            # Keep projects.sdg_ids/typology_codes in sync with the junction tables
+            with self.engine.connect() as conn:
+                for trigger_sql in TAG_ARRAY_TRIGGERS:
+                    conn.execute(text(trigger_sql))
                 conn.commit()
 
             # Populate reference data
@@ -92,6 +111,20 @@ class AtlasPostgreSQLDB(DatabaseInterface):
             logger.error(f"Failed to initialize schema: {e}")
             raise
 
+    def _apply_storage_parameters(self, tables):
+        """Apply table storage parameters declared in table.info['storage_parameters']"""
+        with self.engine.connect() as conn:
+            server_version = conn.dialect.server_version_info
+            for table in tables:
+                params = {
+                    name: value for name, value in table.info.get('storage_parameters', {}).items()
+                    if server_version >= STORAGE_PARAMETER_MIN_SERVER_VERSION.get(name, ())
+                }
+                if params:
+                    settings = ', '.join(f"{name} = {value}" for name, value in params.items())
+                    conn.execute(text(f"ALTER TABLE {table.name} SET ({settings})"))
+            conn.commit()
+
     def _populate_reference_data(self):
         """Populate reference tables with initial data"""
         with self.get_session() as session:
@@ -219,19 +252,22 @@ class AtlasPostgreSQLDB(DatabaseInterface):
                     s.sdg_name,
                     s.sdg_short_name,
                     s.sdg_color_hex,
-                    COUNT(ps.project_id) as project_count
+                    COUNT(p.project_id) as project_count
                 FROM sdgs s
-                LEFT JOIN project_sdgs ps ON s.sdg_id = ps.sdg_id
-                LEFT JOIN projects p ON ps.project_id = p.project_id
-                    AND p.deleted_at IS NULL
-                    AND p.workflow_status = 'approved'
+                LEFT JOIN (
+                    SELECT project_id, unnest(sdg_ids) AS sdg_id
+                    FROM projects
+                    WHERE deleted_at IS NULL
+                        AND workflow_status = 'approved'
+                ) p ON s.sdg_id = p.sdg_id
                 GROUP BY s.sdg_id, s.sdg_number, s.sdg_name, s.sdg_short_name, s.sdg_color_hex
                 ORDER BY s.sdg_number
                 """))
 
-                # Create unique indexes
-                conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_funding_region_id ON mv_funding_by_region(region_id)"))
-                conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_sdg_distribution_id ON mv_sdg_distribution(sdg_id)"))
+                # Create unique indexes (required for REFRESH ... CONCURRENTLY)
+                for view in (MvFundingByRegion, MvSdgDistribution):
+                    for index in view.__table__.indexes:
+                        index.create(bind=conn, checkfirst=True)
 
                 conn.commit()
                 logger.info("Materialized views created successfully")
@@ -286,12 +322,12 @@ class AtlasPostgreSQLDB(DatabaseInterface):
         """Get all approved/published projects"""
         with self.get_session() as session:
             try:
-                query = session.query(Project, UiaRegion.region_name).join(
+                query = session.query(Project, UiaRegion.region_name).options(*PROJECT_LIST_LOAD_OPTIONS).join(
                     UiaRegion, Project.region_id == UiaRegion.region_id
                 ).filter(
                     Project.workflow_status == 'approved',
                     Project.deleted_at.is_(None)
-                ).order_by(desc(Project.published_date))
+                ).order_by(desc(Project.published_date).nulls_last())
 
                 results = []
                 for project, region_name in query.all():
@@ -315,56 +351,40 @@ class AtlasPostgreSQLDB(DatabaseInterface):
                 else:
                     project_uuid = project_id
 
-                project = session.query(Project).filter_by(project_id=project_uuid).first()
+                # Related data is eager-loaded with the project
+                project = session.query(Project).options(*PROJECT_DETAIL_LOAD_OPTIONS).filter_by(
+                    project_id=project_uuid
+                ).first()
                 if not project:
                     return None
 
-                # Get related data
                 project_dict = self._project_to_dict(project)
+                project_dict['region_name'] = project.region.region_name if project.region else None
 
-                # Get region name
-                region = session.query(UiaRegion).filter_by(region_id=project.region_id).first()
-                project_dict['region_name'] = region.region_name if region else None
+                project_dict['sdgs'] = [self._sdg_to_dict(ps.sdg) for ps in project.project_sdgs]
 
-                # Get SDGs
-                sdgs = session.query(Sdg).join(ProjectSdg).filter(
-                    ProjectSdg.project_id == project.project_id
-                ).all()
-                project_dict['sdgs'] = [self._sdg_to_dict(sdg) for sdg in sdgs]
-
-                # Get typologies
-                typologies = session.query(ProjectTypology, Typology).join(
-                    Typology, ProjectTypology.typology_code == Typology.typology_code
-                ).filter(ProjectTypology.project_id == project.project_id).all()
                 project_dict['typologies'] = [
-                    {'typology': typ.typology_name, 'code': typ.typology_code}
-                    for pt, typ in typologies
+                    {'typology': pt.typology.typology_name, 'code': pt.typology.typology_code}
+                    for pt in project.project_typologies
                 ]
 
-                # Get requirements
-                requirements = session.query(ProjectRequirement, Requirement).join(
-                    Requirement, ProjectRequirement.requirement_code == Requirement.requirement_code
-                ).filter(ProjectRequirement.project_id == project.project_id).all()
                 project_dict['requirements'] = [
                     {
-                        'requirement_category': req.requirement_category,
-                        'requirement_text': req.requirement_name,
-                        'requirement_code': req.requirement_code
+                        'requirement_category': pr.requirement.requirement_category,
+                        'requirement_text': pr.requirement.requirement_name,
+                        'requirement_code': pr.requirement.requirement_code
                     }
-                    for pr, req in requirements
+                    for pr in project.project_requirements
                 ]
 
-                # Get images
-                images = session.query(ProjectImage).filter_by(project_id=project.project_id).order_by(
-                    ProjectImage.display_order
-                ).all()
+                # Images are ordered by display_order on the relationship
                 project_dict['images'] = [
                     {
                         'image_url': img.image_url,
                         'alt_text': img.image_alt_text,
                         'display_order': img.display_order
                     }
-                    for img in images
+                    for img in project.project_images
                 ]
 
                 return project_dict
@@ -379,7 +399,7 @@ class AtlasPostgreSQLDB(DatabaseInterface):
         """Filter projects by multiple criteria with advanced PostGIS support"""
         with self.get_session() as session:
             try:
-                query = session.query(Project, UiaRegion.region_name).join(
+                query = session.query(Project, UiaRegion.region_name).options(*PROJECT_LIST_LOAD_OPTIONS).join(
                     UiaRegion, Project.region_id == UiaRegion.region_id
                 ).filter(
                     Project.workflow_status == 'approved',
@@ -391,7 +411,7 @@ class AtlasPostgreSQLDB(DatabaseInterface):
                     query = query.filter(UiaRegion.region_name == region)
 
                 if sdg:
-                    query = query.join(ProjectSdg).filter(ProjectSdg.sdg_id == sdg)
+                    query = query.filter(Project.sdg_ids.contains([sdg]))
 
                 if city:
                     query = query.filter(func.lower(Project.city) == func.lower(city))
@@ -459,6 +479,13 @@ class AtlasPostgreSQLDB(DatabaseInterface):
                 # Generate project slug
                 slug = self._generate_project_slug(form_data['project_name'], session)
 
+                # Junction rows only; TAG_ARRAY_TRIGGERS copy them onto the project's tag arrays
+                from src.constants import TYPOLOGY_CODES, REQUIREMENT_CODES
+                sdg_ids = list(dict.fromkeys(form_data.get('sdgs', [])))
+                typology_codes = list(dict.fromkeys(
+                    TYPOLOGY_CODES.get(typology_name, 'OTHER') for typology_name in form_data.get('typologies', [])
+                ))
+
                 # Create project
                 project = Project(
                     project_name=form_data['project_name'],
@@ -483,45 +510,39 @@ class AtlasPostgreSQLDB(DatabaseInterface):
                 session.add(project)
                 session.flush()  # Get project ID
 
-                # Add SDGs
-                for sdg_id in form_data.get('sdgs', []):
-                    project_sdg = ProjectSdg(project_id=project.project_id, sdg_id=sdg_id)
-                    session.add(project_sdg)
-
-                # Add typologies
-                from src.constants import TYPOLOGY_CODES
-                for typology_name in form_data.get('typologies', []):
-                    typology_code = TYPOLOGY_CODES.get(typology_name, 'OTHER')
-                    project_typology = ProjectTypology(
-                        project_id=project.project_id,
-                        typology_code=typology_code
-                    )
-                    session.add(project_typology)
-
-                # Add requirements
-                from src.constants import REQUIREMENT_CODES
-                for req in form_data.get('requirements', []):
-                    req_text = req.get('text', '')
-                    req_code = REQUIREMENT_CODES.get(req_text, 'OTHER_CUSTOM')
-                    category = req.get('category', 'other')
+                # Add SDGs, typologies, requirements and images as executemany INSERTs
+                child_rows = [
+                    (ProjectSdg, [
+                        {'project_id': project.project_id, 'sdg_id': sdg_id}
+                        for sdg_id in sdg_ids
+                    ]),
+                    (ProjectTypology, [
+                        {'project_id': project.project_id, 'typology_code': typology_code}
+                        for typology_code in typology_codes
+                    ]),
+                    (ProjectRequirement, [
+                        {
+                            'project_id': project.project_id,
+                            'requirement_code': REQUIREMENT_CODES.get(req.get('text', ''), 'OTHER_CUSTOM'),
+                            'requirement_category': req.get('category', 'other')
+                        }
+                        for req in form_data.get('requirements', [])
+                    ]),
+                    (ProjectImage, [
+                        {
+                            'project_id': project.project_id,
+                            'image_url': image_url.strip(),
+                            'image_alt_text': f"Project image {i+1}",
+                            'display_order': i
+                        }
+                        for i, image_url in enumerate(form_data.get('image_urls', []))
+                        if image_url.strip()
+                    ]),
+                ]
 
-                    project_requirement = ProjectRequirement(
-                        project_id=project.project_id,
-                        requirement_code=req_code,
-                        requirement_category=category
-                    )
-                    session.add(project_requirement)
-
-                # Add images
-                for i, image_url in enumerate(form_data.get('image_urls', [])):
-                    if image_url.strip():
-                        project_image = ProjectImage(
-                            project_id=project.project_id,
-                            image_url=image_url.strip(),
-                            image_alt_text=f"Project image {i+1}",
-                            display_order=i
-                        )
-                        session.add(project_image)
+                for model, rows in child_rows:
+                    if rows:
+                        session.execute(model.__table__.insert(), rows)
 
                 session.commit()
 
@@ -597,7 +618,7 @@ class AtlasPostgreSQLDB(DatabaseInterface):
         """Get projects pending review"""
         with self.get_session() as session:
             try:
-                query = session.query(Project, UiaRegion.region_name).join(
+                query = session.query(Project, UiaRegion.region_name).options(*PROJECT_LIST_LOAD_OPTIONS).join(
                     UiaRegion, Project.region_id == UiaRegion.region_id
                 ).filter(
                     Project.workflow_status.in_(['submitted', 'in_review', 'changes_requested']),
@@ -774,7 +795,7 @@ class AtlasPostgreSQLDB(DatabaseInterface):
         with self.get_session() as session:
             try:
                 # Create full-text search query
-                search_query = session.query(Project, UiaRegion.region_name).join(
+                search_query = session.query(Project, UiaRegion.region_name).options(*PROJECT_LIST_LOAD_OPTIONS).join(
                     UiaRegion, Project.region_id == UiaRegion.region_id
                 ).filter(
                     Project.workflow_status == 'approved',
@@ -899,12 +920,16 @@ class AtlasPostgreSQLDB(DatabaseInterface):
         projects = self.get_projects_by_filters(**(filters or {}))
         df = pd.DataFrame(projects)
 
-        from src.utils import export_to_csv, export_to_xlsx
+        from src.utils import export_to_csv, export_to_xlsx, export_to_parquet, export_to_feather
 
         if format.lower() == "csv":
             return export_to_csv(df)
         elif format.lower() in ["xlsx", "excel"]:
             return export_to_xlsx(df)
+        elif format.lower() == "parquet":
+            return export_to_parquet(df)
+        elif format.lower() == "feather":
+            return export_to_feather(df)
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
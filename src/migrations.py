@@ -3,13 +3,20 @@ Migration tools for Atlas 3+3 application
 Handles data migration from SQLite to PostgreSQL and schema versioning
 """
 
+import io
 import logging
+import re
 import uuid
-from datetime import datetime, timezone
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+import psycopg2.errors
+from psycopg2.extras import execute_values, register_uuid
+
 from sqlalchemy import create_engine, text, MetaData, Table
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
@@ -18,14 +25,27 @@ from src.config import get_config, DatabaseType
 from src.database import AtlasDB
 from src.database_postgres import AtlasPostgreSQLDB
 from src.models_postgres import (
-    Base, Project, User, UiaRegion, Sdg, ProjectSdg, ProjectTypology,
+    Base, Project, User, ProjectSdg, ProjectTypology,
     ProjectRequirement, ProjectImage, ProjectWorkflowHistory, Review,
-    Typology, Requirement
+    TAG_ARRAY_SOURCES
 )
-from src.constants import TYPOLOGY_CODES, REQUIREMENT_CODES
+from src.constants import TYPOLOGY_CODES, REQUIREMENT_CODES, MIGRATION_BATCH_SIZE
 
 logger = logging.getLogger(__name__)
 
+# Project slug normalisation
+_SLUG_STRIP = re.compile(r'[^a-zA-Z0-9\s-]')
+_SLUG_SPACES = re.compile(r'\s+')
+
+# Errors raised when the server or a pooler rejects COPY itself; data errors must not fall back
+_COPY_UNAVAILABLE_ERRORS = (psycopg2.errors.FeatureNotSupported, psycopg2.errors.InsufficientPrivilege)
+
+# Tables written by the migration; their secondary indexes are rebuilt after the load
+BULK_LOAD_TABLES = [
+    User.__table__, Project.__table__, ProjectSdg.__table__, ProjectTypology.__table__,
+    ProjectRequirement.__table__, ProjectImage.__table__, ProjectWorkflowHistory.__table__
+]
+
 class MigrationManager:
     """Manages database migrations and data transfers"""
 
@@ -34,6 +54,9 @@ class MigrationManager:
         self.sqlite_db = None
         self.postgres_db = None
         self.migration_log = []
+        # SQLite ID -> PostgreSQL UUID, indexed by SQLite ID for vectorized Series.map lookups
+        self.user_id_mapping = pd.Series(dtype=object)
+        self.project_id_mapping = pd.Series(dtype=object)
 
     def setup_databases(self, sqlite_path: str = None, postgres_config: Dict = None):
         """Setup source SQLite and target PostgreSQL databases"""
@@ -128,10 +151,10 @@ class MigrationManager:
             with self.postgres_db.get_session() as session:
                 # Reference data is already populated during PostgreSQL initialization
                 # Verify it exists
-                regions_count = session.query(UiaRegion).count()
-                sdgs_count = session.query(Sdg).count()
-                typologies_count = session.query(Typology).count()
-                requirements_count = session.query(Requirement).count()
+                regions_count, sdgs_count, typologies_count, requirements_count = session.execute(text(
+                    "SELECT (SELECT COUNT(*) FROM uia_regions), (SELECT COUNT(*) FROM sdgs), "
+                    "(SELECT COUNT(*) FROM typologies), (SELECT COUNT(*) FROM requirements)"
+                )).fetchone()
 
                 logger.info(f"Reference data verified: {regions_count} regions, {sdgs_count} SDGs, "
                           f"{typologies_count} typologies, {requirements_count} requirements")
@@ -150,42 +173,40 @@ class MigrationManager:
 
     def migrate_users(self) -> bool:
         """Migrate users from SQLite to PostgreSQL"""
+        sqlite_conn = None
         try:
             logger.info("Migrating users...")
 
-            # Get users from SQLite
-            sqlite_conn = self.sqlite_db.get_connection()
-            users_df = pd.read_sql("SELECT * FROM users", sqlite_conn)
-            sqlite_conn.close()
-
-            if users_df.empty:
-                logger.warning("No users found in SQLite database")
-                return True
-
-            user_id_mapping = {}  # Map SQLite IDs to PostgreSQL UUIDs
+            user_id_chunks = []  # Map SQLite IDs to PostgreSQL UUIDs
 
+            # Stream users from SQLite
+            sqlite_conn = self._get_sqlite_source_connection()
             with self.postgres_db.get_session() as session:
-                for _, sqlite_user in tqdm(users_df.iterrows(), total=len(users_df), desc="Migrating users"):
-                    # Create PostgreSQL user
-                    pg_user = User(
-                        email=sqlite_user['email'],
-                        full_name=sqlite_user.get('contact_person', sqlite_user['email']),
-                        role='admin' if sqlite_user.get('is_admin') else 'submitter',
-                        organization_affiliation=sqlite_user.get('organization_name'),
-                        is_active=True
-                    )
-
-                    session.add(pg_user)
-                    session.flush()  # Get the UUID
+                for users_df in self._read_sqlite_chunks(sqlite_conn, "users", "Migrating users"):
+                    # Generate UUIDs up front so the mapping needs no per-row round-trip
+                    user_ids = [uuid.uuid4() for _ in range(len(users_df))]
+                    pg_users_df = pd.DataFrame({
+                        'user_id': user_ids,
+                        'email': users_df['email'],
+                        'full_name': users_df['contact_person'].fillna(users_df['email']),
+                        'role': users_df['is_admin'].fillna(False).astype(bool).map({True: 'admin', False: 'submitter'}),
+                        'organization_affiliation': users_df['organization_name'],
+                        'is_active': True
+                    })
+
+                    self._copy_dataframe(session, 'users', pg_users_df)
+                    session.commit()
 
                     # Store mapping for project migration
-                    user_id_mapping[sqlite_user['id']] = pg_user.user_id
+                    user_id_chunks.append(pd.Series(user_ids, index=users_df['id'].to_numpy(), dtype=object))
 
-                session.commit()
+            self.user_id_mapping = pd.concat(user_id_chunks) if user_id_chunks else pd.Series(dtype=object)
+            if self.user_id_mapping.empty:
+                logger.warning("No users found in SQLite database")
+                return True
 
-            self.user_id_mapping = user_id_mapping
-            logger.info(f"Migrated {len(users_df)} users successfully")
-            self.migration_log.append(f"Migrated {len(users_df)} users")
+            logger.info(f"Migrated {len(self.user_id_mapping)} users successfully")
+            self.migration_log.append(f"Migrated {len(self.user_id_mapping)} users")
             return True
 
         except Exception as e:
@@ -193,81 +214,134 @@ class MigrationManager:
             self.migration_log.append(f"User migration failed: {e}")
             return False
 
+        finally:
+            if sqlite_conn is not None:
+                sqlite_conn.close()
+
     def migrate_projects(self) -> bool:
         """Migrate projects and related data from SQLite to PostgreSQL"""
+        sqlite_conn = None
         try:
             logger.info("Migrating projects...")
 
-            # Get projects from SQLite
-            sqlite_conn = self.sqlite_db.get_connection()
-            projects_df = pd.read_sql("""
+            project_id_chunks = []  # Map SQLite IDs to PostgreSQL UUIDs
+            self._used_slugs = set()  # Target table is empty (checked during validation)
+
+            # Stream projects and their related rows from one SQLite read transaction
+            sqlite_conn = self._get_sqlite_source_connection()
+            sqlite_conn.execute("BEGIN")
+            projects_query = """
                 SELECT p.*, ur.name as region_name
                 FROM projects p
                 LEFT JOIN uia_regions ur ON p.uia_region_id = ur.id
-            """, sqlite_conn)
+            """
 
-            if projects_df.empty:
-                logger.warning("No projects found in SQLite database")
-                return True
+            with self.postgres_db.get_session() as session:
+                for projects_df in self._read_sqlite_chunks(sqlite_conn, "projects", "Migrating projects", projects_query):
+                    projects_df['workflow_status'] = projects_df['workflow_status'].fillna('submitted')
 
-            project_id_mapping = {}  # Map SQLite IDs to PostgreSQL UUIDs
+                    # Low-cardinality text; category dtype stores it as small integer codes
+                    for col in ('project_status', 'workflow_status', 'country', 'city'):
+                        projects_df[col] = projects_df[col].astype('category')
 
-            with self.postgres_db.get_session() as session:
-                for _, sqlite_project in tqdm(projects_df.iterrows(), total=len(projects_df), desc="Migrating projects"):
-                    try:
-                        # Create PostgreSQL project
-                        pg_project = Project(
-                            project_name=sqlite_project['project_name'],
-                            project_slug=self._generate_slug(sqlite_project['project_name'], session),
-                            organization_name=sqlite_project['organization_name'],
-                            contact_person=sqlite_project['contact_person'],
-                            contact_email=sqlite_project['contact_email'],
-                            project_status=sqlite_project['project_status'],
-                            city=sqlite_project['city'],
-                            country=sqlite_project['country'],
-                            region_id=sqlite_project['uia_region_id'],
-                            latitude=float(sqlite_project['latitude']) if sqlite_project['latitude'] else None,
-                            longitude=float(sqlite_project['longitude']) if sqlite_project['longitude'] else None,
-                            funding_needed_usd=float(sqlite_project['funding_needed_usd']) if sqlite_project['funding_needed_usd'] else None,
-                            brief_description=sqlite_project['brief_description'],
-                            detailed_description=sqlite_project['detailed_description'],
-                            success_factors=sqlite_project.get('success_factors'),
-                            workflow_status=sqlite_project['workflow_status'],
-                            submission_date=self._parse_datetime(sqlite_project.get('created_at')),
-                            created_by_user_id=self.user_id_mapping.get(sqlite_project.get('submitted_by')),
-                            created_at=self._parse_datetime(sqlite_project.get('created_at')),
-                            updated_at=self._parse_datetime(sqlite_project.get('updated_at'))
-                        )
+                    for col in ('created_at', 'updated_at'):
+                        projects_df[col] = self._parse_datetime_column(projects_df[col])
+
+                    for col in ('latitude', 'longitude', 'funding_needed_usd'):
+                        projects_df[col] = pd.to_numeric(projects_df[col], errors='coerce')
+
+                    projects_df['base_slug'] = (
+                        projects_df['project_name'].str.lower()
+                        .str.replace(_SLUG_STRIP, '', regex=True)
+                        .str.strip()
+                        .str.replace(_SLUG_SPACES, '-', regex=True)
+                    )
 
+                    # Generate UUIDs up front so the mapping needs no per-row round-trip
+                    project_ids = [uuid.uuid4() for _ in range(len(projects_df))]
+                    updated_at = projects_df['updated_at']
+                    approved_dates = updated_at.where(projects_df['workflow_status'] == 'approved')
+
+                    pg_projects_df = pd.DataFrame({
+                        'project_id': project_ids,
+                        'project_name': projects_df['project_name'],
+                        'project_slug': [self._generate_slug(base_slug) for base_slug in projects_df['base_slug']],
+                        'organization_name': projects_df['organization_name'],
+                        'contact_person': projects_df['contact_person'],
+                        'contact_email': projects_df['contact_email'],
+                        'project_status': projects_df['project_status'],
+                        'city': projects_df['city'],
+                        'country': projects_df['country'],
+                        'region_id': projects_df['uia_region_id'].astype('Int16'),
+                        'latitude': projects_df['latitude'],
+                        'longitude': projects_df['longitude'],
+                        'funding_needed_usd': projects_df['funding_needed_usd'].fillna(0),
+                        'currency_original': 'USD',
+                        'brief_description': projects_df['brief_description'],
+                        'detailed_description': projects_df['detailed_description'],
+                        'success_factors': projects_df['success_factors'],
+                        'workflow_status': projects_df['workflow_status'],
+                        'submission_date': projects_df['created_at'],
                         # Set approval/published dates for approved projects
-                        if pg_project.workflow_status == 'approved':
-                            pg_project.approval_date = pg_project.updated_at
-                            pg_project.published_date = pg_project.updated_at
+                        'approval_date': approved_dates,
+                        'published_date': approved_dates,
+                        'created_at': projects_df['created_at'],
+                        'updated_at': updated_at,
+                        'created_by_user_id': projects_df['submitted_by'].map(self.user_id_mapping)
+                    })
 
-                        session.add(pg_project)
-                        session.flush()  # Get the UUID
+                    self._copy_dataframe(session, 'projects', pg_projects_df)
+                    session.commit()
 
-                        # Store mapping for related data migration
-                        project_id_mapping[sqlite_project['id']] = pg_project.project_id
+                    # Store mapping for related data migration
+                    project_id_chunks.append(pd.Series(project_ids, index=projects_df['id'].to_numpy(), dtype=object))
 
-                    except Exception as e:
-                        logger.error(f"Failed to migrate project {sqlite_project['project_name']}: {e}")
-                        continue
+            self.project_id_mapping = pd.concat(project_id_chunks) if project_id_chunks else pd.Series(dtype=object)
+            if self.project_id_mapping.empty:
+                logger.warning("No projects found in SQLite database")
+                return True
 
-                session.commit()
+            logger.info(f"Migrated {len(self.project_id_mapping)} projects successfully")
+            self.migration_log.append(f"Migrated {len(self.project_id_mapping)} projects")
+
+            # Migrate related data; chunks are read here and written by the thread pool,
+            # which only depends on the completed ID mappings
+            related_tables = [
+                ("project_sdgs", "Migrating project SDGs", self._migrate_project_sdgs, "project-SDG relationships"),
+                ("project_typologies", "Migrating project typologies", self._migrate_project_typologies, "project typologies"),
+                ("project_requirements", "Migrating project requirements", self._migrate_project_requirements, "project requirements"),
+                ("project_images", "Migrating project images", self._migrate_project_images, "project images"),
+                ("project_workflow_history", "Migrating workflow history", self._migrate_workflow_history, "workflow history records"),
+            ]
+            max_workers = len(related_tables)
+            table_futures = {}
 
-            self.project_id_mapping = project_id_mapping
-            logger.info(f"Migrated {len(project_id_mapping)} projects successfully")
-            self.migration_log.append(f"Migrated {len(project_id_mapping)} projects")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = set()
+                for table_name, desc, helper, label in related_tables:
+                    futures = table_futures[label] = []
+                    for chunk in self._read_sqlite_chunks(sqlite_conn, table_name, desc):
+                        # Bound the number of chunks held in memory
+                        if len(pending) >= 2 * max_workers:
+                            _, pending = wait(pending, return_when=FIRST_COMPLETED)
 
-            # Migrate related data
-            self._migrate_project_sdgs(sqlite_conn)
-            self._migrate_project_typologies(sqlite_conn)
-            self._migrate_project_requirements(sqlite_conn)
-            self._migrate_project_images(sqlite_conn)
-            self._migrate_workflow_history(sqlite_conn)
+                        future = executor.submit(helper, chunk)
+                        futures.append(future)
+                        pending.add(future)
+
+            sqlite_conn.commit()  # End the read transaction
+
+            # A failed chunk re-raises here and fails the whole migration
+            migrated_counts = {
+                label: sum(future.result() for future in futures)
+                for label, futures in table_futures.items()
+            }
+
+            self._populate_project_tag_arrays()
+
+            for label, count in migrated_counts.items():
+                logger.info(f"Migrated {count} {label}")
 
-            sqlite_conn.close()
             return True
 
         except Exception as e:
@@ -275,149 +349,123 @@ class MigrationManager:
             self.migration_log.append(f"Project migration failed: {e}")
             return False
 
-    def _migrate_project_sdgs(self, sqlite_conn):
-        """Migrate project-SDG relationships"""
+        finally:
+            if sqlite_conn is not None:
+                sqlite_conn.close()
+
+    def _migrate_project_sdgs(self, sdgs_df: pd.DataFrame) -> int:
+        """Migrate a chunk of project-SDG relationships"""
         try:
-            sdgs_df = pd.read_sql("SELECT * FROM project_sdgs", sqlite_conn)
+            rows = pd.DataFrame({
+                'project_id': sdgs_df['project_id'].map(self.project_id_mapping),
+                'sdg_id': sdgs_df['sdg_id']
+            }).dropna(subset=['project_id'])
 
             with self.postgres_db.get_session() as session:
-                for _, sqlite_sdg in tqdm(sdgs_df.iterrows(), total=len(sdgs_df), desc="Migrating project SDGs"):
-                    sqlite_project_id = sqlite_sdg['project_id']
-                    pg_project_id = self.project_id_mapping.get(sqlite_project_id)
-
-                    if pg_project_id:
-                        pg_project_sdg = ProjectSdg(
-                            project_id=pg_project_id,
-                            sdg_id=sqlite_sdg['sdg_id']
-                        )
-                        session.add(pg_project_sdg)
-
+                self._copy_dataframe(session, 'project_sdgs', rows)
                 session.commit()
 
-            logger.info(f"Migrated {len(sdgs_df)} project-SDG relationships")
+            return len(rows)
 
         except Exception as e:
             logger.error(f"Failed to migrate project SDGs: {e}")
+            raise
 
-    def _migrate_project_typologies(self, sqlite_conn):
-        """Migrate project typologies"""
+    def _migrate_project_typologies(self, typologies_df: pd.DataFrame) -> int:
+        """Migrate a chunk of project typologies"""
         try:
-            typologies_df = pd.read_sql("SELECT * FROM project_typologies", sqlite_conn)
+            typology_codes = typologies_df['typology'].astype('category').map(TYPOLOGY_CODES).fillna('OTHER')
 
-            with self.postgres_db.get_session() as session:
-                for _, sqlite_typology in tqdm(typologies_df.iterrows(), total=len(typologies_df), desc="Migrating project typologies"):
-                    sqlite_project_id = sqlite_typology['project_id']
-                    pg_project_id = self.project_id_mapping.get(sqlite_project_id)
-
-                    if pg_project_id:
-                        typology_name = sqlite_typology['typology']
-                        typology_code = TYPOLOGY_CODES.get(typology_name, 'OTHER')
-
-                        pg_project_typology = ProjectTypology(
-                            project_id=pg_project_id,
-                            typology_code=typology_code
-                        )
-                        session.add(pg_project_typology)
+            rows = pd.DataFrame({
+                'project_id': typologies_df['project_id'].map(self.project_id_mapping),
+                'typology_code': typology_codes
+            }).dropna(subset=['project_id'])
 
+            with self.postgres_db.get_session() as session:
+                self._copy_dataframe(session, 'project_typologies', rows)
                 session.commit()
 
-            logger.info(f"Migrated {len(typologies_df)} project typologies")
+            return len(rows)
 
         except Exception as e:
             logger.error(f"Failed to migrate project typologies: {e}")
+            raise
 
-    def _migrate_project_requirements(self, sqlite_conn):
-        """Migrate project requirements"""
+    def _migrate_project_requirements(self, requirements_df: pd.DataFrame) -> int:
+        """Migrate a chunk of project requirements"""
         try:
-            requirements_df = pd.read_sql("SELECT * FROM project_requirements", sqlite_conn)
+            req_codes = requirements_df['requirement_text'].astype('category').map(REQUIREMENT_CODES).fillna('OTHER_CUSTOM')
+
+            # Map category; str.contains on a categorical only scans the distinct values
+            category = requirements_df['requirement_category'].astype('category')
+            category_enum = np.select(
+                [category.str.contains('Funding|Financial', na=False),
+                 category.str.contains('Government|Regulatory', na=False)],
+                ['funding', 'government_regulatory'],
+                default='other'
+            )
+
+            rows = pd.DataFrame({
+                'project_id': requirements_df['project_id'].map(self.project_id_mapping),
+                'requirement_code': req_codes,
+                'requirement_category': category_enum
+            }).dropna(subset=['project_id'])
 
             with self.postgres_db.get_session() as session:
-                for _, sqlite_req in tqdm(requirements_df.iterrows(), total=len(requirements_df), desc="Migrating project requirements"):
-                    sqlite_project_id = sqlite_req['project_id']
-                    pg_project_id = self.project_id_mapping.get(sqlite_project_id)
-
-                    if pg_project_id:
-                        req_text = sqlite_req['requirement_text']
-                        req_code = REQUIREMENT_CODES.get(req_text, 'OTHER_CUSTOM')
-
-                        # Map category
-                        category = sqlite_req['requirement_category']
-                        if 'Funding' in category or 'Financial' in category:
-                            category_enum = 'funding'
-                        elif 'Government' in category or 'Regulatory' in category:
-                            category_enum = 'government_regulatory'
-                        else:
-                            category_enum = 'other'
-
-                        pg_project_requirement = ProjectRequirement(
-                            project_id=pg_project_id,
-                            requirement_code=req_code,
-                            requirement_category=category_enum
-                        )
-                        session.add(pg_project_requirement)
-
+                self._copy_dataframe(session, 'project_requirements', rows)
                 session.commit()
 
-            logger.info(f"Migrated {len(requirements_df)} project requirements")
+            return len(rows)
 
         except Exception as e:
             logger.error(f"Failed to migrate project requirements: {e}")
+            raise
 
-    def _migrate_project_images(self, sqlite_conn):
-        """Migrate project images"""
+    def _migrate_project_images(self, images_df: pd.DataFrame) -> int:
+        """Migrate a chunk of project images"""
         try:
-            images_df = pd.read_sql("SELECT * FROM project_images", sqlite_conn)
+            rows = pd.DataFrame({
+                'project_id': images_df['project_id'].map(self.project_id_mapping),
+                'image_url': images_df['image_url'],
+                'image_alt_text': images_df['alt_text'],
+                'display_order': 0,  # Default order
+                'uploaded_at': self._parse_datetime_column(images_df['created_at'])
+            }).dropna(subset=['project_id'])
 
             with self.postgres_db.get_session() as session:
-                for _, sqlite_image in tqdm(images_df.iterrows(), total=len(images_df), desc="Migrating project images"):
-                    sqlite_project_id = sqlite_image['project_id']
-                    pg_project_id = self.project_id_mapping.get(sqlite_project_id)
-
-                    if pg_project_id:
-                        pg_project_image = ProjectImage(
-                            project_id=pg_project_id,
-                            image_url=sqlite_image['image_url'],
-                            image_alt_text=sqlite_image.get('alt_text', ''),
-                            display_order=0,  # Default order
-                            uploaded_at=self._parse_datetime(sqlite_image.get('created_at'))
-                        )
-                        session.add(pg_project_image)
-
+                self._copy_dataframe(session, 'project_images', rows)
                 session.commit()
 
-            logger.info(f"Migrated {len(images_df)} project images")
+            return len(rows)
 
         except Exception as e:
             logger.error(f"Failed to migrate project images: {e}")
+            raise
 
-    def _migrate_workflow_history(self, sqlite_conn):
-        """Migrate workflow history"""
+    def _migrate_workflow_history(self, history_df: pd.DataFrame) -> int:
+        """Migrate a chunk of workflow history"""
         try:
-            history_df = pd.read_sql("SELECT * FROM project_workflow_history", sqlite_conn)
+            history_rows = pd.DataFrame({
+                'project_id': history_df['project_id'].map(self.project_id_mapping),
+                'workflow_from': history_df['old_status'],
+                'workflow_to': history_df['new_status'],
+                'changed_by_user_id': history_df['changed_by'].map(self.user_id_mapping),
+                'reason_notes': history_df['reason'],
+                'changed_at': self._parse_datetime_column(history_df['created_at'])
+            }).dropna(subset=['project_id', 'changed_by_user_id'])
+
+            # NaN becomes None so optional columns receive NULL
+            rows = history_rows.astype(object).where(history_rows.notna(), None).to_dict('records')
 
             with self.postgres_db.get_session() as session:
-                for _, sqlite_history in tqdm(history_df.iterrows(), total=len(history_df), desc="Migrating workflow history"):
-                    sqlite_project_id = sqlite_history['project_id']
-                    pg_project_id = self.project_id_mapping.get(sqlite_project_id)
-                    pg_user_id = self.user_id_mapping.get(sqlite_history.get('changed_by'))
-
-                    if pg_project_id and pg_user_id:
-                        pg_workflow_history = ProjectWorkflowHistory(
-                            project_id=pg_project_id,
-                            workflow_from=sqlite_history.get('old_status'),
-                            workflow_to=sqlite_history['new_status'],
-                            changed_by_user_id=pg_user_id,
-                            reason_notes=sqlite_history.get('reason'),
-                            changed_at=self._parse_datetime(sqlite_history.get('created_at'))
-                        )
-                        session.add(pg_workflow_history)
-
+                session.bulk_insert_mappings(ProjectWorkflowHistory, rows)
                 session.commit()
 
-            logger.info(f"Migrated {len(history_df)} workflow history records")
+            return len(rows)
 
         except Exception as e:
             logger.error(f"Failed to migrate workflow history: {e}")
+            raise
 
     def perform_full_migration(self) -> bool:
         """Perform complete migration from SQLite to PostgreSQL"""
@@ -439,12 +487,16 @@ class MigrationManager:
                 ("Projects and related data", self.migrate_projects),
             ]
 
-            for step_name, step_function in steps:
-                logger.info(f"Starting: {step_name}")
-                if not step_function():
-                    logger.error(f"Migration failed at step: {step_name}")
-                    return False
-                logger.info(f"Completed: {step_name}")
+            dropped_indexes = self._prepare_bulk_load()
+            try:
+                for step_name, step_function in steps:
+                    logger.info(f"Starting: {step_name}")
+                    if not step_function():
+                        logger.error(f"Migration failed at step: {step_name}")
+                        return False
+                    logger.info(f"Completed: {step_name}")
+            finally:
+                self._finish_bulk_load(dropped_indexes)
 
             # Refresh materialized views
             logger.info("Refreshing materialized views...")
@@ -469,13 +521,15 @@ class MigrationManager:
 
             # Count records in both databases
             sqlite_conn = self.sqlite_db.get_connection()
-            sqlite_projects = pd.read_sql("SELECT COUNT(*) as count FROM projects", sqlite_conn).iloc[0]['count']
-            sqlite_users = pd.read_sql("SELECT COUNT(*) as count FROM users", sqlite_conn).iloc[0]['count']
+            sqlite_projects, sqlite_users = sqlite_conn.execute(
+                "SELECT (SELECT COUNT(*) FROM projects), (SELECT COUNT(*) FROM users)"
+            ).fetchone()
             sqlite_conn.close()
 
             with self.postgres_db.get_session() as session:
-                pg_projects = session.query(Project).count()
-                pg_users = session.query(User).count()
+                pg_projects, pg_users = session.execute(text(
+                    "SELECT (SELECT COUNT(*) FROM projects), (SELECT COUNT(*) FROM users)"
+                )).fetchone()
 
             logger.info(f"Migration validation:")
             logger.info(f"  Projects: SQLite={sqlite_projects}, PostgreSQL={pg_projects}")
@@ -490,42 +544,149 @@ class MigrationManager:
         except Exception as e:
             logger.error(f"Validation failed: {e}")
 
-    def _generate_slug(self, project_name: str, session) -> str:
-        """Generate unique project slug"""
-        import re
-        base_slug = re.sub(r'[^a-zA-Z0-9\s-]', '', project_name.lower())
-        base_slug = re.sub(r'\s+', '-', base_slug.strip())
+    def _get_sqlite_source_connection(self):
+        """Open a SQLite connection tuned for the full-table scans of a migration"""
+        sqlite_conn = self.sqlite_db.get_connection()
+        sqlite_conn.execute("PRAGMA synchronous=OFF")  # Source is only read during migration
+        sqlite_conn.execute("PRAGMA cache_size=-200000")  # ~200 MB page cache
+        sqlite_conn.execute("PRAGMA temp_store=MEMORY")
+        return sqlite_conn
+
+    def _populate_project_tag_arrays(self):
+        """Fill the denormalized projects.sdg_ids/typology_codes arrays from the junction tables"""
+        # The sync triggers are disabled during the bulk load; one set-based UPDATE per array replaces them
+        with self.postgres_db.get_session() as session:
+            session.execute(text("""
+                UPDATE projects p SET sdg_ids = s.sdg_ids
+                FROM (
+                    SELECT project_id, array_agg(sdg_id ORDER BY sdg_id) AS sdg_ids
+                    FROM project_sdgs GROUP BY project_id
+                ) s
+                WHERE p.project_id = s.project_id
+            """))
+            session.execute(text("""
+                UPDATE projects p SET typology_codes = t.typology_codes
+                FROM (
+                    SELECT project_id, array_agg(typology_code ORDER BY typology_code) AS typology_codes
+                    FROM project_typologies GROUP BY project_id
+                ) t
+                WHERE p.project_id = t.project_id
+            """))
+            session.commit()
+
+    def _prepare_bulk_load(self) -> List:
+        """Drop non-unique secondary indexes and pause autovacuum and tag sync triggers on the target tables"""
+        table_names = [table.name for table in BULK_LOAD_TABLES]
+
+        with self.postgres_db.get_session() as session:
+            existing = {
+                row[0] for row in session.execute(
+                    text("SELECT indexname FROM pg_indexes WHERE tablename = ANY(:tables)"),
+                    {'tables': table_names}
+                )
+            }
+
+            # Unique indexes stay in place; the load relies on them for correctness
+            dropped_indexes = [
+                index for table in BULK_LOAD_TABLES for index in table.indexes
+                if not index.unique and index.name in existing
+            ]
+            for index in dropped_indexes:
+                session.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+            for table_name in table_names:
+                session.execute(text(f"ALTER TABLE {table_name} SET (autovacuum_enabled = false)"))
+
+            # Tag arrays are filled once after the load instead of per COPY statement
+            for table_name, _, _ in TAG_ARRAY_SOURCES:
+                session.execute(text(f"ALTER TABLE {table_name} DISABLE TRIGGER USER"))
+
+            session.commit()
 
+        logger.info(f"Dropped {len(dropped_indexes)} secondary indexes for bulk load")
+        return dropped_indexes
+
+    def _finish_bulk_load(self, dropped_indexes: List):
+        """Recreate indexes dropped for the bulk load, re-enable autovacuum and triggers, and refresh statistics"""
+        table_names = [table.name for table in BULK_LOAD_TABLES]
+
+        with self.postgres_db.get_session() as session:
+            for index in dropped_indexes:
+                index.create(bind=session.connection())
+
+            for table_name in table_names:
+                session.execute(text(f"ALTER TABLE {table_name} RESET (autovacuum_enabled)"))
+
+            for table_name, _, _ in TAG_ARRAY_SOURCES:
+                session.execute(text(f"ALTER TABLE {table_name} ENABLE TRIGGER USER"))
+
+            session.commit()
+
+        # ANALYZE is cheap next to the load and gives the planner fresh statistics
+        with self.postgres_db.get_session() as session:
+            for table_name in table_names:
+                session.execute(text(f"ANALYZE {table_name}"))
+            session.commit()
+
+        logger.info(f"Recreated {len(dropped_indexes)} secondary indexes")
+
+    def _read_sqlite_chunks(self, sqlite_conn, table_name: str, desc: str, query: str = None):
+        """Stream a SQLite table in MIGRATION_BATCH_SIZE chunks with a progress bar"""
+        total = sqlite_conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+        query = query or f"SELECT * FROM {table_name}"
+
+        with tqdm(total=total, desc=desc) as progress:
+            for chunk in pd.read_sql(query, sqlite_conn, chunksize=MIGRATION_BATCH_SIZE):
+                yield chunk
+                progress.update(len(chunk))
+
+    def _copy_dataframe(self, session, table_name: str, df: pd.DataFrame):
+        """Bulk load a DataFrame with COPY FROM STDIN, falling back to execute_values"""
+        columns = ", ".join(df.columns)
+        cursor = session.connection().connection.cursor()
+
+        try:
+            # Explicit NULL marker so empty strings are not loaded as NULL
+            buffer = io.StringIO()
+            df.to_csv(buffer, index=False, header=False, na_rep='\\N')
+            buffer.seek(0)
+
+            cursor.execute("SAVEPOINT bulk_copy")
+            try:
+                cursor.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+                cursor.execute("RELEASE SAVEPOINT bulk_copy")
+            except _COPY_UNAVAILABLE_ERRORS as e:
+                # Some hosted PostgreSQL setups and poolers reject COPY
+                logger.warning(f"COPY into {table_name} not available, using execute_values: {e}")
+                cursor.execute("ROLLBACK TO SAVEPOINT bulk_copy")
+
+                register_uuid(conn_or_curs=cursor)
+                rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+                execute_values(cursor, f"INSERT INTO {table_name} ({columns}) VALUES %s", list(rows))
+        finally:
+            cursor.close()
+
+    def _generate_slug(self, base_slug: str) -> str:
+        """Generate unique project slug from a normalised base slug"""
         slug = base_slug[:80]  # Limit length
         counter = 1
 
-        while session.query(Project).filter_by(project_slug=slug).first():
+        while slug in self._used_slugs:
             slug = f"{base_slug[:70]}-{counter}"
             counter += 1
 
+        self._used_slugs.add(slug)
         return slug
 
-    def _parse_datetime(self, date_str):
-        """Parse datetime string from SQLite"""
-        if not date_str:
-            return datetime.now(timezone.utc)
+    def _parse_datetime_column(self, values: pd.Series) -> pd.Series:
+        """Parse a column of SQLite datetime strings as UTC timestamps"""
+        parsed = pd.to_datetime(values, errors='coerce', utc=True, format='ISO8601')
 
-        try:
-            # Try different datetime formats
-            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d']:
-                try:
-                    dt = datetime.strptime(str(date_str), fmt)
-                    return dt.replace(tzinfo=timezone.utc)
-                except ValueError:
-                    continue
+        unparsed = parsed.isna() & values.notna()
+        if unparsed.any():
+            logger.warning(f"Could not parse {unparsed.sum()} '{values.name}' values, using current time")
 
-            # If all formats fail, return current time
-            logger.warning(f"Could not parse datetime: {date_str}")
-            return datetime.now(timezone.utc)
-
-        except Exception as e:
-            logger.warning(f"Datetime parsing error for '{date_str}': {e}")
-            return datetime.now(timezone.utc)
+        return parsed.fillna(pd.Timestamp.now(tz='UTC'))
 
     def get_migration_summary(self) -> Dict[str, Any]:
         """Get migration summary report"""
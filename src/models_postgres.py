@@ -4,12 +4,13 @@ Includes PostGIS geography types, UUIDs, enums, and materialized views
 """
 
 from sqlalchemy import (
-    Column, String, Integer, Numeric, Text, Boolean, DateTime, Enum,
-    ForeignKey, Index, CheckConstraint, UniqueConstraint, text
+    Column, String, CHAR, Integer, SmallInteger, BigInteger, Numeric, Text, Boolean, DateTime, Enum,
+    ForeignKey, Index, CheckConstraint, Computed, Identity, text
 )
-from sqlalchemy.dialects.postgresql import UUID, ENUM as PgEnum
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, ENUM as PgEnum
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.types import UserDefinedType
+from sqlalchemy.orm import relationship, joinedload, selectinload, raiseload, validates
 from sqlalchemy.sql import func
 from geoalchemy2 import Geography
 from datetime import datetime, timezone
@@ -38,11 +39,42 @@ requirement_category_enum = PgEnum(
     name='requirement_category_enum'
 )
 
+# Email domain: case-insensitive CITEXT with one shared CHECK instead of a copy per table
+EMAIL_ADDRESS_DOMAIN = """
+DO $$
+BEGIN
+    CREATE DOMAIN email_address AS CITEXT
+        CHECK (position('@' in VALUE) > 1 AND char_length(VALUE) <= 255);
+EXCEPTION
+    WHEN duplicate_object THEN NULL;
+END
+$$;
+"""
+
+class EmailAddress(UserDefinedType):
+    """Column type rendered as the email_address domain"""
+    cache_ok = True
+
+    def get_col_spec(self, **kw):
+        return 'email_address'
+
+# Storage parameters applied with ALTER TABLE ... SET after create_all (see table.info['storage_parameters'])
+# Append-only tables: pack pages fully and vacuum on inserts so BRIN ranges get summarized (PG13+)
+APPEND_ONLY_STORAGE_PARAMETERS = {
+    'fillfactor': 100,
+    'autovacuum_vacuum_insert_scale_factor': 0.05,
+}
+
+# Storage parameters newer than the oldest supported server; skipped on older versions
+STORAGE_PARAMETER_MIN_SERVER_VERSION = {
+    'autovacuum_vacuum_insert_scale_factor': (13,),
+}
+
 class UiaRegion(Base):
     """UIA Regions reference table"""
     __tablename__ = 'uia_regions'
 
-    region_id = Column(Integer, primary_key=True, autoincrement=False)
+    region_id = Column(SmallInteger, primary_key=True, autoincrement=False)
     region_name = Column(String(100), nullable=False)
     region_code = Column(String(10), nullable=False, unique=True)
     region_description = Column(Text)
@@ -60,10 +92,10 @@ class Sdg(Base):
     __tablename__ = 'sdgs'
 
     sdg_id = Column(Integer, primary_key=True)
-    sdg_number = Column(Integer, nullable=False, unique=True)
+    sdg_number = Column(SmallInteger, nullable=False, unique=True)
     sdg_name = Column(String(255), nullable=False)
     sdg_short_name = Column(String(100))
-    sdg_color_hex = Column(String(7), nullable=False)
+    sdg_color_hex = Column(CHAR(7), nullable=False)  # Always '#RRGGBB'
     sdg_color_pantone = Column(String(20))
     sdg_icon_url = Column(String(500))
     sdg_description = Column(Text)
@@ -84,7 +116,7 @@ class Typology(Base):
     typology_code = Column(String(50), primary_key=True)
     typology_name = Column(String(100), nullable=False)
     typology_description = Column(Text)
-    display_order = Column(Integer, default=0)
+    display_order = Column(SmallInteger, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -98,7 +130,7 @@ class Requirement(Base):
     requirement_name = Column(String(150), nullable=False)
     requirement_category = Column(requirement_category_enum, nullable=False)
     requirement_description = Column(Text)
-    display_order = Column(Integer, default=0)
+    display_order = Column(SmallInteger, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -109,7 +141,7 @@ class User(Base):
     __tablename__ = 'users'
 
     user_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    email = Column(String(255), nullable=False, unique=True)
+    email = Column(EmailAddress, nullable=False, unique=True)  # Case-insensitive equality and uniqueness
     full_name = Column(String(255), nullable=False)
     role = Column(user_role_enum, nullable=False, default='submitter')
     organization_affiliation = Column(String(255))
@@ -125,7 +157,6 @@ class User(Base):
     reviews = relationship("Review", back_populates="reviewer")
 
     __table_args__ = (
-        CheckConstraint("email ~* '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}$'", name='valid_email'),
         Index('idx_users_email', 'email'),
         Index('idx_users_role', 'role'),
         Index('idx_users_is_active', 'is_active'),
@@ -142,7 +173,7 @@ class Project(Base):
     # Organization & Contact
     organization_name = Column(String(255), nullable=False)
     contact_person = Column(String(255), nullable=False)
-    contact_email = Column(String(255), nullable=False)
+    contact_email = Column(EmailAddress, nullable=False)
 
     # Project Status
     project_status = Column(project_status_enum, nullable=False)
@@ -150,10 +181,13 @@ class Project(Base):
     # Location & Geography
     city = Column(String(255), nullable=False)
     country = Column(String(100), nullable=False)
-    region_id = Column(Integer, ForeignKey('uia_regions.region_id'), nullable=False)
+    region_id = Column(SmallInteger, ForeignKey('uia_regions.region_id'), nullable=False)
     latitude = Column(Numeric(10, 8), nullable=False)
     longitude = Column(Numeric(11, 8), nullable=False)
-    geolocation = Column(Geography('POINT', srid=4326))
+    geolocation = Column(
+        Geography('POINT', srid=4326, spatial_index=False),  # Indexed in __table_args__
+        Computed("ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography", persisted=True)
+    )
 
     # Funding
     funding_needed_usd = Column(Numeric(15, 2), default=0)
@@ -165,6 +199,11 @@ class Project(Base):
     detailed_description = Column(Text, nullable=False)
     success_factors = Column(Text)
 
+    # Denormalized tags for index-only tag filters; project_sdgs/project_typologies stay the source of truth
+    # and keep these in sync through TAG_ARRAY_TRIGGERS
+    sdg_ids = Column(ARRAY(Integer), nullable=False, server_default='{}')
+    typology_codes = Column(ARRAY(String(50)), nullable=False, server_default='{}')
+
     # Workflow & Status
     workflow_status = Column(workflow_status_enum, nullable=False, default='submitted')
     submission_date = Column(DateTime(timezone=True), server_default=func.now())
@@ -186,7 +225,8 @@ class Project(Base):
     project_sdgs = relationship("ProjectSdg", back_populates="project", cascade="all, delete-orphan")
     project_typologies = relationship("ProjectTypology", back_populates="project", cascade="all, delete-orphan")
     project_requirements = relationship("ProjectRequirement", back_populates="project", cascade="all, delete-orphan")
-    project_images = relationship("ProjectImage", back_populates="project", cascade="all, delete-orphan")
+    project_images = relationship("ProjectImage", back_populates="project", cascade="all, delete-orphan",
+                                  order_by="ProjectImage.display_order")
     workflow_history = relationship("ProjectWorkflowHistory", back_populates="project", cascade="all, delete-orphan")
     reviews = relationship("Review", back_populates="project", cascade="all, delete-orphan")
 
@@ -195,34 +235,58 @@ class Project(Base):
         CheckConstraint('longitude BETWEEN -180 AND 180', name='valid_longitude'),
         CheckConstraint('funding_needed_usd >= 0', name='valid_funding_needed'),
         CheckConstraint('funding_spent_usd >= 0', name='valid_funding_spent'),
-        CheckConstraint("contact_email ~* '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}$'", name='valid_email_format'),
-        CheckConstraint(
-            '(approval_date IS NULL OR approval_date >= submission_date) AND '
-            '(published_date IS NULL OR published_date >= approval_date)',
-            name='valid_workflow_dates'
-        ),
+        CheckConstraint('approval_date IS NULL OR approval_date >= submission_date', name='approval_after_submission'),
+        CheckConstraint('published_date IS NULL OR published_date >= approval_date', name='published_after_approval'),
 
         # Indexes for performance
         Index('idx_projects_workflow_status', 'workflow_status', postgresql_where=text('deleted_at IS NULL')),
-        Index('idx_projects_country', 'country', postgresql_where=text('deleted_at IS NULL')),
-        Index('idx_projects_city', 'city', postgresql_where=text('deleted_at IS NULL')),
-        Index('idx_projects_region_id', 'region_id', postgresql_where=text('deleted_at IS NULL')),
-        Index('idx_projects_published_date', 'published_date', postgresql_ops={'published_date': 'DESC'}, postgresql_where=text('deleted_at IS NULL')),
-        Index('idx_projects_project_status', 'project_status', postgresql_where=text('deleted_at IS NULL')),
+        # Covering index for the published listing; INCLUDE columns allow index-only scans
+        # and NULLS LAST matches the listing's ORDER BY so no sort step is needed
+        Index('idx_projects_published_date', 'published_date', postgresql_ops={'published_date': 'DESC NULLS LAST'},
+              postgresql_include=['project_id', 'project_name', 'organization_name', 'region_id'],
+              postgresql_where=text("deleted_at IS NULL AND workflow_status = 'approved'")),
+        # Composite browse indexes: region filter with status/recency, and country -> city lookups
+        Index('idx_projects_browse', 'region_id', 'project_status', 'published_date', postgresql_ops={'published_date': 'DESC'}, postgresql_where=text('deleted_at IS NULL')),
+        Index('idx_projects_location', 'country', 'city', postgresql_where=text('deleted_at IS NULL')),
+        # Approval dashboards: recently approved projects
+        Index('idx_projects_approved', 'approval_date', postgresql_where=text("deleted_at IS NULL AND workflow_status = 'approved'")),
         Index('idx_projects_project_name', 'project_name', postgresql_using='gin', postgresql_ops={'project_name': 'gin_trgm_ops'}, postgresql_where=text('deleted_at IS NULL')),
         Index('idx_projects_slug', 'project_slug', postgresql_where=text('deleted_at IS NULL')),
 
-        # Spatial index
-        Index('idx_projects_geolocation', 'geolocation', postgresql_using='gist', postgresql_where=text('deleted_at IS NULL')),
+        # Trigram indexes for substring/fuzzy search (ILIKE '%...%')
+        Index('idx_projects_city_trgm', 'city', postgresql_using='gin', postgresql_ops={'city': 'gin_trgm_ops'}, postgresql_where=text('deleted_at IS NULL')),
+        Index('idx_projects_country_trgm', 'country', postgresql_using='gin', postgresql_ops={'country': 'gin_trgm_ops'}, postgresql_where=text('deleted_at IS NULL')),
+        Index('idx_projects_organization_name_trgm', 'organization_name', postgresql_using='gin', postgresql_ops={'organization_name': 'gin_trgm_ops'}, postgresql_where=text('deleted_at IS NULL')),
+
+        # Tag containment filters (sdg_ids @> ARRAY[7])
+        Index('idx_projects_sdg_ids', 'sdg_ids', postgresql_using='gin'),
+        Index('idx_projects_typology_codes', 'typology_codes', postgresql_using='gin'),
+
+        # Spatial index (SP-GiST suits point-only data; spgist_geography_ops_nd requires PostGIS 3+)
+        Index('idx_projects_geolocation', 'geolocation', postgresql_using='spgist', postgresql_where=text('deleted_at IS NULL')),
+
+        # Update-heavy: leave page room for HOT updates and vacuum/analyze well before the 20% default
+        {'info': {'storage_parameters': {
+            'fillfactor': 80,
+            'autovacuum_vacuum_scale_factor': 0.02,
+            'autovacuum_analyze_scale_factor': 0.01,
+        }}},
     )
 
+    @validates('project_id')
+    def validate_project_id(self, key, value):
+        """Store project IDs as uuid.UUID so lookups compare against the PK index without a text cast"""
+        if isinstance(value, str):
+            return uuid.UUID(value)
+        return value
+
 class ProjectSdg(Base):
     """Projects to SDGs junction table"""
     __tablename__ = 'project_sdgs'
 
-    id = Column(Integer, primary_key=True)
-    project_id = Column(UUID(as_uuid=True), ForeignKey('projects.project_id', ondelete='CASCADE'), nullable=False)
-    sdg_id = Column(Integer, ForeignKey('sdgs.sdg_id'), nullable=False)
+    # Composite natural key; leads with project_id for per-project lookups
+    project_id = Column(UUID(as_uuid=True), ForeignKey('projects.project_id', ondelete='CASCADE'), primary_key=True)
+    sdg_id = Column(Integer, ForeignKey('sdgs.sdg_id'), primary_key=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -230,8 +294,6 @@ class ProjectSdg(Base):
     sdg = relationship("Sdg", back_populates="project_sdgs")
 
     __table_args__ = (
-        UniqueConstraint('project_id', 'sdg_id', name='unique_project_sdg'),
-        Index('idx_project_sdgs_project_id', 'project_id'),
         Index('idx_project_sdgs_sdg_id', 'sdg_id'),
     )
 
@@ -239,9 +301,9 @@ class ProjectTypology(Base):
     """Projects to typologies junction table"""
     __tablename__ = 'project_typologies'
 
-    id = Column(Integer, primary_key=True)
-    project_id = Column(UUID(as_uuid=True), ForeignKey('projects.project_id', ondelete='CASCADE'), nullable=False)
-    typology_code = Column(String(50), ForeignKey('typologies.typology_code'), nullable=False)
+    # Composite natural key; leads with project_id for per-project lookups
+    project_id = Column(UUID(as_uuid=True), ForeignKey('projects.project_id', ondelete='CASCADE'), primary_key=True)
+    typology_code = Column(String(50), ForeignKey('typologies.typology_code'), primary_key=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -249,8 +311,6 @@ class ProjectTypology(Base):
     typology = relationship("Typology", back_populates="project_typologies")
 
     __table_args__ = (
-        UniqueConstraint('project_id', 'typology_code', name='unique_project_typology'),
-        Index('idx_project_typologies_project_id', 'project_id'),
         Index('idx_project_typologies_typology_code', 'typology_code'),
     )
 
@@ -258,9 +318,9 @@ class ProjectRequirement(Base):
     """Projects to requirements junction table"""
     __tablename__ = 'project_requirements'
 
-    id = Column(Integer, primary_key=True)
-    project_id = Column(UUID(as_uuid=True), ForeignKey('projects.project_id', ondelete='CASCADE'), nullable=False)
-    requirement_code = Column(String(50), ForeignKey('requirements.requirement_code'), nullable=False)
+    # Composite natural key; leads with project_id for per-project lookups
+    project_id = Column(UUID(as_uuid=True), ForeignKey('projects.project_id', ondelete='CASCADE'), primary_key=True)
+    requirement_code = Column(String(50), ForeignKey('requirements.requirement_code'), primary_key=True)
     requirement_category = Column(requirement_category_enum, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -269,8 +329,6 @@ class ProjectRequirement(Base):
     requirement = relationship("Requirement", back_populates="project_requirements")
 
     __table_args__ = (
-        UniqueConstraint('project_id', 'requirement_code', name='unique_project_requirement'),
-        Index('idx_project_requirements_project_id', 'project_id'),
         Index('idx_project_requirements_requirement_code', 'requirement_code'),
         Index('idx_project_requirements_category', 'requirement_category'),
     )
@@ -279,11 +337,11 @@ class ProjectImage(Base):
     """Project images table"""
     __tablename__ = 'project_images'
 
-    id = Column(Integer, primary_key=True)
+    id = Column(BigInteger, Identity(always=True, cache=100), primary_key=True)
     project_id = Column(UUID(as_uuid=True), ForeignKey('projects.project_id', ondelete='CASCADE'), nullable=False)
     image_url = Column(String(1000), nullable=False)
     image_alt_text = Column(String(500))
-    display_order = Column(Integer, default=0)
+    display_order = Column(SmallInteger, default=0)
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -291,7 +349,7 @@ class ProjectImage(Base):
 
     __table_args__ = (
         CheckConstraint('display_order >= 0', name='valid_display_order'),
-        Index('idx_project_images_project_id', 'project_id'),
+        # Also serves WHERE project_id = ? via its leading column
         Index('idx_project_images_display_order', 'project_id', 'display_order'),
     )
 
@@ -299,7 +357,7 @@ class ProjectWorkflowHistory(Base):
     """Project workflow history (audit log)"""
     __tablename__ = 'project_workflow_history'
 
-    id = Column(Integer, primary_key=True)
+    id = Column(BigInteger, Identity(always=True, cache=100), primary_key=True)
     project_id = Column(UUID(as_uuid=True), ForeignKey('projects.project_id', ondelete='CASCADE'), nullable=False)
     workflow_from = Column(workflow_status_enum)
     workflow_to = Column(workflow_status_enum, nullable=False)
@@ -314,15 +372,18 @@ class ProjectWorkflowHistory(Base):
     __table_args__ = (
         CheckConstraint('workflow_from IS NULL OR workflow_from != workflow_to', name='different_workflow_states'),
         Index('idx_workflow_history_project_id', 'project_id'),
-        Index('idx_workflow_history_changed_at', 'changed_at', postgresql_ops={'changed_at': 'DESC'}),
+        # Append-only log: changed_at follows physical row order, so BRIN covers range scans
+        Index('idx_workflow_history_changed_at_brin', 'changed_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
         Index('idx_workflow_history_changed_by', 'changed_by_user_id'),
+
+        {'info': {'storage_parameters': APPEND_ONLY_STORAGE_PARAMETERS}},
     )
 
 class Review(Base):
     """Reviews table (admin feedback)"""
     __tablename__ = 'reviews'
 
-    review_id = Column(Integer, primary_key=True)
+    review_id = Column(BigInteger, Identity(always=True, cache=100), primary_key=True)
     project_id = Column(UUID(as_uuid=True), ForeignKey('projects.project_id', ondelete='CASCADE'), nullable=False)
     reviewer_user_id = Column(UUID(as_uuid=True), ForeignKey('users.user_id'), nullable=False)
     review_status = Column(workflow_status_enum, nullable=False)
@@ -337,15 +398,19 @@ class Review(Base):
         CheckConstraint("review_status IN ('approved', 'rejected', 'changes_requested')", name='valid_review_status'),
         Index('idx_reviews_project_id', 'project_id'),
         Index('idx_reviews_reviewer_id', 'reviewer_user_id'),
-        Index('idx_reviews_reviewed_at', 'reviewed_at', postgresql_ops={'reviewed_at': 'DESC'}),
+        Index('idx_reviews_reviewed_at_brin', 'reviewed_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+
+        {'info': {'storage_parameters': APPEND_ONLY_STORAGE_PARAMETERS}},
     )
 
 # Materialized Views (for read-only analytics)
+# Created by AtlasPostgreSQLDB._create_materialized_views, not by metadata.create_all (info['is_view']).
+# The unique indexes are what allow REFRESH MATERIALIZED VIEW CONCURRENTLY.
 class MvFundingByRegion(Base):
     """Materialized view for funding by region analytics"""
     __tablename__ = 'mv_funding_by_region'
 
-    region_id = Column(Integer, primary_key=True)
+    region_id = Column(SmallInteger, primary_key=True)
     region_name = Column(String(100))
     region_code = Column(String(10))
     project_count = Column(Integer)
@@ -353,64 +418,80 @@ class MvFundingByRegion(Base):
     total_funding_spent = Column(Numeric(15, 2))
     avg_funding_needed = Column(Numeric(15, 2))
 
+    __table_args__ = (
+        Index('idx_mv_funding_region_id', 'region_id', unique=True),
+        {'info': {'is_view': True}},
+    )
+
 class MvSdgDistribution(Base):
     """Materialized view for SDG distribution analytics"""
     __tablename__ = 'mv_sdg_distribution'
 
     sdg_id = Column(Integer, primary_key=True)
-    sdg_number = Column(Integer)
+    sdg_number = Column(SmallInteger)
     sdg_name = Column(String(255))
     sdg_short_name = Column(String(100))
-    sdg_color_hex = Column(String(7))
+    sdg_color_hex = Column(CHAR(7))
     project_count = Column(Integer)
 
-# Triggers (defined as SQL, not in SQLAlchemy models)
-# These will be created in the database initialization
+    __table_args__ = (
+        Index('idx_mv_sdg_distribution_id', 'sdg_id', unique=True),
+        {'info': {'is_view': True}},
+    )
 
-TRIGGER_FUNCTIONS = [
-    """
-    CREATE OR REPLACE FUNCTION update_project_geolocation()
-    RETURNS TRIGGER AS $$
-    BEGIN
-        NEW.geolocation := ST_SetSRID(ST_MakePoint(NEW.longitude, NEW.latitude), 4326)::geography;
-        RETURN NEW;
-    END;
-    $$ LANGUAGE plpgsql;
-    """,
+# Loader option profiles for Project queries
+# List views only read project columns, so any relationship access is a bug (N+1); raise instead
+PROJECT_LIST_LOAD_OPTIONS = (raiseload('*'),)
+
+# Detail views load each collection with one SELECT ... IN query instead of per-row lazy loads
+PROJECT_DETAIL_LOAD_OPTIONS = (
+    joinedload(Project.region),
+    selectinload(Project.project_sdgs).joinedload(ProjectSdg.sdg),
+    selectinload(Project.project_typologies).joinedload(ProjectTypology.typology),
+    selectinload(Project.project_requirements).joinedload(ProjectRequirement.requirement),
+    selectinload(Project.project_images),
+)
 
-    """
-    CREATE OR REPLACE FUNCTION update_updated_at_column()
+# No row triggers: updated_at is set by onupdate=func.now() in every ORM flush and Core update(),
+# and projects.geolocation is a generated column
+
+# Denormalized tag arrays on projects: (junction table, array column, tag column)
+TAG_ARRAY_SOURCES = [
+    ('project_sdgs', 'sdg_ids', 'sdg_id'),
+    ('project_typologies', 'typology_codes', 'typology_code'),
+]
+
+# Statement-level triggers rebuild the arrays from the junction tables for every project a
+# statement touched, so seed scripts and raw SQL keep them in sync without application code
+TAG_ARRAY_TRIGGERS = [
+    f"""
+    CREATE OR REPLACE FUNCTION sync_projects_{array_column}()
     RETURNS TRIGGER AS $$
     BEGIN
-        NEW.updated_at = CURRENT_TIMESTAMP;
-        RETURN NEW;
+        UPDATE projects p
+        SET {array_column} = COALESCE(
+            (SELECT array_agg(j.{tag_column} ORDER BY j.{tag_column})
+             FROM {table_name} j WHERE j.project_id = p.project_id),
+            '{{}}'
+        )
+        WHERE p.project_id IN (SELECT project_id FROM changed_rows);
+        RETURN NULL;
     END;
     $$ LANGUAGE plpgsql;
-    """
-]
-
-TRIGGERS = [
-    """
-    DROP TRIGGER IF EXISTS trigger_update_geolocation ON projects;
-    CREATE TRIGGER trigger_update_geolocation
-    BEFORE INSERT OR UPDATE OF latitude, longitude ON projects
-    FOR EACH ROW
-    EXECUTE FUNCTION update_project_geolocation();
-    """,
-
-    """
-    DROP TRIGGER IF EXISTS trigger_projects_updated_at ON projects;
-    CREATE TRIGGER trigger_projects_updated_at
-    BEFORE UPDATE ON projects
-    FOR EACH ROW
-    EXECUTE FUNCTION update_updated_at_column();
-    """,
 
+    DROP TRIGGER IF EXISTS trigger_{table_name}_sync_insert ON {table_name};
+    CREATE TRIGGER trigger_{table_name}_sync_insert
+    AFTER INSERT ON {table_name}
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION sync_projects_{array_column}();
+
+    DROP TRIGGER IF EXISTS trigger_{table_name}_sync_delete ON {table_name};
+    CREATE TRIGGER trigger_{table_name}_sync_delete
+    AFTER DELETE ON {table_name}
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION sync_projects_{array_column}();
     """
-    DROP TRIGGER IF EXISTS trigger_users_updated_at ON users;
-    CREATE TRIGGER trigger_users_updated_at
-    BEFORE UPDATE ON users
-    FOR EACH ROW
-    EXECUTE FUNCTION update_updated_at_column();
-    """
-]
\ No newline at end of file
+    for table_name, array_column, tag_column in TAG_ARRAY_SOURCES
+]
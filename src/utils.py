@@ -4,9 +4,12 @@ Utility functions for Atlas 3+3 application
 
 import re
 import io
+import math
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 import streamlit as st
 from src.constants import (
     EMAIL_REGEX, URL_REGEX, CURRENCY_SYMBOL, LAT_MIN, LAT_MAX, LON_MIN, LON_MAX,
@@ -16,6 +19,20 @@ from src.constants import (
     EXPORT_FILENAME_PREFIX, STATUS_COLORS, SDGS
 )
 
+# Patterns compiled once at import; validators run on every form submit
+_EMAIL_RE = re.compile(EMAIL_REGEX)
+_URL_RE = re.compile(URL_REGEX)
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+
+# (suffix, divisor) indexed by thousands exponent, for format_large_number
+_NUMBER_SUFFIXES = (("", 1), ("K", 1_000), ("M", 1_000_000), ("B", 1_000_000_000))
+
+# Range errors depend only on constants, so format them once
+_LAT_RANGE_ERROR = f"Latitude must be between {LAT_MIN} and {LAT_MAX}"
+_LON_RANGE_ERROR = f"Longitude must be between {LON_MIN} and {LON_MAX}"
+
+@lru_cache(maxsize=4096)
 def format_currency(amount: float, include_symbol: bool = True) -> str:
     """Format USD amounts with commas and $ sign"""
     if pd.isna(amount) or amount is None:
@@ -26,131 +43,127 @@ def format_currency(amount: float, include_symbol: bool = True) -> str:
     else:
         return f"{amount:,.0f}"
 
+@lru_cache(maxsize=4096)
 def format_large_number(number: int) -> str:
     """Format large numbers with K, M, B suffixes"""
-    if number >= 1_000_000_000:
-        return f"{number / 1_000_000_000:.1f}B"
-    elif number >= 1_000_000:
-        return f"{number / 1_000_000:.1f}M"
-    elif number >= 1_000:
-        return f"{number / 1_000:.1f}K"
-    else:
+    # NaN/inf have no log10; they also fail every comparison, which the old chain rendered as-is
+    if number < 1_000 or not math.isfinite(number):
         return str(number)
 
+    # Thousands exponent (1 = K, 2 = M, 3 = B) picks the suffix and divisor
+    suffix, divisor = _NUMBER_SUFFIXES[min(int(math.log10(number)) // 3, 3)]
+    return f"{number / divisor:.1f}{suffix}"
+
 def validate_email(email: str) -> bool:
     """Validate email format"""
-    if not email:
+    # Cheap containment check rejects obviously malformed input before the regex
+    if not email or '@' not in email:
         return False
-    return bool(re.match(EMAIL_REGEX, email))
+    return _EMAIL_RE.match(email) is not None
 
 def validate_url(url: str) -> bool:
     """Validate URL format"""
     if not url:
         return True  # URLs are optional
-    return bool(re.match(URL_REGEX, url))
+    return bool(_URL_RE.match(url))
 
-def validate_coordinates(lat: Optional[float], lon: Optional[float]) -> Tuple[bool, str]:
-    """Validate lat/lon range"""
+def validate_coordinates(lat: Optional[float], lon: Optional[float]) -> Optional[str]:
+    """Validate lat/lon range; returns an error message, or None if valid"""
     if lat is None and lon is None:
-        return True, ""
+        return None
 
     if lat is None or lon is None:
-        return False, "Both latitude and longitude must be provided together"
+        return "Both latitude and longitude must be provided together"
 
     if not (LAT_MIN <= lat <= LAT_MAX):
-        return False, f"Latitude must be between {LAT_MIN} and {LAT_MAX}"
+        return _LAT_RANGE_ERROR
 
     if not (LON_MIN <= lon <= LON_MAX):
-        return False, f"Longitude must be between {LON_MIN} and {LON_MAX}"
+        return _LON_RANGE_ERROR
 
-    return True, ""
+    return None
 
-def validate_funding_amount(amount: Optional[float]) -> Tuple[bool, str]:
-    """Validate funding amount"""
+def validate_funding_amount(amount: Optional[float]) -> Optional[str]:
+    """Validate funding amount; returns an error message, or None if valid"""
     if amount is None:
-        return True, ""  # Funding is optional
+        return None  # Funding is optional
 
     if not (MIN_FUNDING_AMOUNT <= amount <= MAX_FUNDING_AMOUNT):
-        return False, ERROR_MESSAGES["funding_range"]
+        return ERROR_MESSAGES["funding_range"]
 
-    return True, ""
+    return None
 
-def validate_text_length(text: str, max_length: int, field_name: str) -> Tuple[bool, str]:
-    """Validate text field length"""
+def validate_text_length(text: str, max_length: int, field_name: str) -> Optional[str]:
+    """Validate text field length; returns an error message, or None if valid"""
     if len(text) > max_length:
-        return False, f"{field_name} exceeds maximum length of {max_length} characters"
-    return True, ""
+        return f"{field_name} exceeds maximum length of {max_length} characters"
+    return None
 
-def validate_required_field(value: Any, field_name: str) -> Tuple[bool, str]:
-    """Validate required field is not empty"""
+def validate_required_field(value: Any, field_name: str) -> Optional[str]:
+    """Validate required field is not empty; returns an error message, or None if valid"""
     if not value or (isinstance(value, str) and not value.strip()):
-        return False, f"{field_name} is required"
-    return True, ""
+        return f"{field_name} is required"
+    return None
+
+# Field specs for validate_project_form: (form key, display name, required, max length or None)
+_FORM_FIELDS = (
+    ("project_name", "Project name", True, MAX_PROJECT_NAME_LENGTH),
+    ("organization_name", "Organization name", True, MAX_ORGANIZATION_NAME_LENGTH),
+    ("contact_person", "Contact person", True, MAX_CONTACT_PERSON_LENGTH),
+    ("contact_email", "Contact email", True, None),
+    ("city", "City", True, None),
+    ("country", "Country", True, None),
+    ("project_status", "Project status", True, None),
+    ("uia_region_id", "UIA region", True, None),
+    ("brief_description", "Brief description", True, MAX_BRIEF_DESCRIPTION_LENGTH),
+    ("detailed_description", "Detailed description", True, MAX_DETAILED_DESCRIPTION_LENGTH),
+    ("success_factors", "Success factors", False, MAX_SUCCESS_FACTORS_LENGTH),
+)
 
 def validate_project_form(form_data: Dict[str, Any]) -> List[str]:
     """Validate entire project submission form"""
     errors = []
-
-    # Required fields
-    required_fields = [
-        ("project_name", "Project name"),
-        ("organization_name", "Organization name"),
-        ("contact_person", "Contact person"),
-        ("contact_email", "Contact email"),
-        ("city", "City"),
-        ("country", "Country"),
-        ("project_status", "Project status"),
-        ("uia_region_id", "UIA region"),
-        ("brief_description", "Brief description"),
-        ("detailed_description", "Detailed description")
-    ]
-
-    for field, name in required_fields:
-        is_valid, error = validate_required_field(form_data.get(field), name)
-        if not is_valid:
-            errors.append(error)
+    get = form_data.get
+
+    # Required fields and text lengths, one lookup per field
+    for field, name, required, max_len in _FORM_FIELDS:
+        value = get(field)
+        if required:
+            error = validate_required_field(value, name)
+            if error:
+                errors.append(error)
+                continue
+        if max_len is not None and value:
+            error = validate_text_length(value, max_len, name)
+            if error:
+                errors.append(error)
 
     # Email validation
-    if form_data.get("contact_email") and not validate_email(form_data["contact_email"]):
+    contact_email = get("contact_email")
+    if contact_email and not validate_email(contact_email):
         errors.append(ERROR_MESSAGES["invalid_email"])
 
-    # Text length validation
-    text_fields = [
-        ("project_name", MAX_PROJECT_NAME_LENGTH, "Project name"),
-        ("brief_description", MAX_BRIEF_DESCRIPTION_LENGTH, "Brief description"),
-        ("detailed_description", MAX_DETAILED_DESCRIPTION_LENGTH, "Detailed description"),
-        ("success_factors", MAX_SUCCESS_FACTORS_LENGTH, "Success factors"),
-        ("organization_name", MAX_ORGANIZATION_NAME_LENGTH, "Organization name"),
-        ("contact_person", MAX_CONTACT_PERSON_LENGTH, "Contact person")
-    ]
-
-    for field, max_len, name in text_fields:
-        if form_data.get(field):
-            is_valid, error = validate_text_length(form_data[field], max_len, name)
-            if not is_valid:
-                errors.append(error)
-
     # Coordinate validation
-    lat = form_data.get("latitude")
-    lon = form_data.get("longitude")
+    lat = get("latitude")
+    lon = get("longitude")
     if lat is not None or lon is not None:
-        is_valid, error = validate_coordinates(lat, lon)
-        if not is_valid:
+        error = validate_coordinates(lat, lon)
+        if error:
             errors.append(error)
 
     # Funding validation
-    funding = form_data.get("funding_needed_usd")
+    funding = get("funding_needed_usd")
     if funding is not None:
-        is_valid, error = validate_funding_amount(funding)
-        if not is_valid:
+        error = validate_funding_amount(funding)
+        if error:
             errors.append(error)
 
     # SDG validation
-    if not form_data.get("sdgs") or len(form_data["sdgs"]) == 0:
+    if not get("sdgs"):
         errors.append(ERROR_MESSAGES["no_sdg_selected"])
 
     # Image URL validation
-    for url in form_data.get("image_urls", []):
+    for url in get("image_urls", []):
         if url and not validate_url(url):
             errors.append(f"Invalid image URL: {url}")
 
@@ -158,34 +171,51 @@ def validate_project_form(form_data: Dict[str, Any]) -> List[str]:
 
 def generate_reference_id() -> str:
     """Generate ATLAS-YYYY-XXXXXX format reference ID"""
-    current_year = datetime.now().year
+    now = datetime.now()
     # Use timestamp for uniqueness in prototype
-    timestamp = int(datetime.now().timestamp())
-    sequence = str(timestamp)[-6:]  # Last 6 digits
-    return f"ATLAS-{current_year}-{sequence}"
+    sequence = str(int(now.timestamp()))[-6:]  # Last 6 digits
+    return f"ATLAS-{now.year}-{sequence}"
 
 def export_to_csv(df: pd.DataFrame, filename_prefix: str = EXPORT_FILENAME_PREFIX) -> bytes:
     """Convert DataFrame to CSV bytes for download"""
-    output = io.StringIO()
-    df.to_csv(output, index=False)
-    return output.getvalue().encode('utf-8')
+    # Binary buffer: pandas encodes while writing, so no second full-size copy from .encode()
+    output = io.BytesIO()
+    df.to_csv(output, index=False, encoding='utf-8')
+    return output.getvalue()
 
 def export_to_xlsx(df: pd.DataFrame, filename_prefix: str = EXPORT_FILENAME_PREFIX) -> bytes:
     """Convert DataFrame to Excel bytes for download"""
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+    # No constant_memory: pandas writes column by column, which that mode cannot handle
+    with pd.ExcelWriter(output, engine='xlsxwriter',
+                        engine_kwargs={'options': {'strings_to_urls': False}}) as writer:
         df.to_excel(writer, index=False, sheet_name='Projects')
     return output.getvalue()
 
+def export_to_parquet(df: pd.DataFrame, filename_prefix: str = EXPORT_FILENAME_PREFIX) -> bytes:
+    """Convert DataFrame to Parquet bytes for download (requires pyarrow)"""
+    output = io.BytesIO()
+    df.to_parquet(output, engine='pyarrow', compression='zstd', index=False)
+    return output.getvalue()
+
+def export_to_feather(df: pd.DataFrame, filename_prefix: str = EXPORT_FILENAME_PREFIX) -> bytes:
+    """Convert DataFrame to Feather bytes for download (requires pyarrow)"""
+    output = io.BytesIO()
+    # Feather only stores a default RangeIndex
+    df.reset_index(drop=True).to_feather(output, compression='zstd')
+    return output.getvalue()
+
 def get_export_filename(file_format: str, prefix: str = EXPORT_FILENAME_PREFIX) -> str:
     """Generate export filename with timestamp"""
     timestamp = datetime.now().strftime(EXPORT_DATE_FORMAT)
     return f"{prefix}_{timestamp}.{file_format}"
 
+@lru_cache(maxsize=128)
 def get_color_for_status(status: str) -> str:
     """Return color hex for project status"""
     return STATUS_COLORS.get(status, "#6c757d")  # Default to gray
 
+@lru_cache(maxsize=128)
 def get_color_for_sdg(sdg_id: int) -> str:
     """Return color hex for SDG"""
     return SDGS.get(sdg_id, {}).get("color", "#6c757d")
@@ -218,11 +248,13 @@ def parse_coordinates(lat_str: str, lon_str: str) -> Tuple[Optional[float], Opti
     except (ValueError, TypeError):
         return None, None
 
+@lru_cache(maxsize=128)
 def format_project_status_badge(status: str) -> str:
     """Format project status as colored badge (HTML)"""
     color = get_color_for_status(status)
     return f'<span style="background-color: {color}; color: white; padding: 2px 8px; border-radius: 12px; font-size: 0.8em;">{status}</span>'
 
+@lru_cache(maxsize=128)
 def format_sdg_badge(sdg_id: int, include_name: bool = True) -> str:
     """Format SDG as colored badge (HTML)"""
     sdg = SDGS.get(sdg_id, {})
@@ -238,83 +270,89 @@ def format_sdg_badge(sdg_id: int, include_name: bool = True) -> str:
 
 def calculate_percentage(part: float, total: float) -> float:
     """Calculate percentage safely"""
-    return safe_divide(part * 100, total, 0.0)
+    return part * 100.0 / total if total else 0.0
 
 def group_requirements_by_category(requirements: List[Dict[str, Any]]) -> Dict[str, List[str]]:
     """Group requirements by category"""
-    grouped = {}
-    for req in requirements:
-        category = req.get("requirement_category", "Other")
-        text = req.get("requirement_text", "")
-        if category not in grouped:
-            grouped[category] = []
-        grouped[category].append(text)
-    return grouped
+    if not requirements:
+        return {}
+
+    df = pd.DataFrame(requirements, columns=["requirement_category", "requirement_text"])
+    return (
+        df.fillna({"requirement_category": "Other", "requirement_text": ""})
+        .groupby("requirement_category", sort=False)["requirement_text"]
+        .agg(list)
+        .to_dict()
+    )
 
 def prepare_chart_data(df: pd.DataFrame, x_col: str, y_col: str, limit: int = 10) -> pd.DataFrame:
     """Prepare data for charts with optional limiting"""
     if df.empty:
         return pd.DataFrame()
 
-    chart_data = df.groupby(x_col)[y_col].agg(['count', 'sum']).reset_index()
-    chart_data = chart_data.sort_values('count', ascending=False)
+    chart_data = df.groupby(x_col, sort=False)[y_col].agg(count='count', sum='sum')
 
-    if len(chart_data) > limit:
-        top_data = chart_data.head(limit - 1)
-        others_count = chart_data.iloc[limit-1:]['count'].sum()
-        others_sum = chart_data.iloc[limit-1:]['sum'].sum()
+    if len(chart_data) <= limit:
+        return chart_data.sort_values('count', ascending=False).reset_index()
 
-        others_row = pd.DataFrame({
-            x_col: ['Others'],
-            'count': [others_count],
-            'sum': [others_sum]
-        })
+    # Partial selection of the top groups instead of sorting every group
+    top_data = chart_data.nlargest(limit - 1, 'count')
+    rest = chart_data.drop(top_data.index)
 
-        chart_data = pd.concat([top_data, others_row], ignore_index=True)
-
-    return chart_data
+    # Append the "Others" row in place rather than concatenating a one-row frame
+    result = top_data.reset_index()
+    result.loc[len(result)] = ['Others', rest['count'].sum(), rest['sum'].sum()]
+    return result
 
 def get_map_bounds(projects: List[Dict[str, Any]]) -> Optional[List[List[float]]]:
     """Calculate map bounds from project coordinates"""
-    coords = []
-    for project in projects:
-        lat = project.get('latitude')
-        lon = project.get('longitude')
-        if lat is not None and lon is not None:
-            coords.append([lat, lon])
-
-    if not coords:
+    # Single pass into an (N, 2) array, then one min/max reduction per axis
+    coords = np.fromiter(
+        ((project['latitude'], project['longitude']) for project in projects
+         if project.get('latitude') is not None and project.get('longitude') is not None),
+        dtype=np.dtype((float, 2))
+    )
+
+    if coords.size == 0:
         return None
 
-    lats = [coord[0] for coord in coords]
-    lons = [coord[1] for coord in coords]
+    min_lat, min_lon = coords.min(axis=0).tolist()
+    max_lat, max_lon = coords.max(axis=0).tolist()
 
     return [
-        [min(lats) - 1, min(lons) - 1],  # Southwest
-        [max(lats) + 1, max(lons) + 1]   # Northeast
+        [min_lat - 1, min_lon - 1],  # Southwest
+        [max_lat + 1, max_lon + 1]   # Northeast
     ]
 
 def filter_empty_values(data: Dict[str, Any]) -> Dict[str, Any]:
     """Remove empty/None values from dictionary"""
-    return {k: v for k, v in data.items() if v is not None and v != ""}
+    # Only strings can equal "", so skip the comparison for other types
+    return {k: v for k, v in data.items()
+            if v is not None and (not isinstance(v, str) or v)}
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe download"""
     # Remove invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    sanitized = filename.translate(_INVALID_FILENAME_CHARS)
     # Remove multiple underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = _MULTI_UNDERSCORE_RE.sub('_', sanitized)
     return sanitized.strip('_')
 
+@lru_cache(maxsize=4096)
 def format_date(date_str: str, format_str: str = "%Y-%m-%d %H:%M") -> str:
     """Format date string for display"""
     try:
-        if isinstance(date_str, str):
-            # Try to parse the date
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return dt.strftime(format_str)
-        return str(date_str)
-    except (ValueError, AttributeError):
+        # pd.NaT is a datetime subclass whose strftime raises ValueError
+        if isinstance(date_str, datetime):
+            return date_str.strftime(format_str)
+        if not isinstance(date_str, str):
+            return str(date_str)
+
+        # Only a trailing 'Z' needs rewriting (fromisoformat rejects it before Python 3.11)
+        if date_str.endswith('Z'):
+            return datetime.fromisoformat(date_str[:-1] + '+00:00').strftime(format_str)
+        return datetime.fromisoformat(date_str).strftime(format_str)
+    except ValueError:
         return str(date_str)
 
 def create_success_message(message_type: str, custom_message: str = None) -> None:
@@ -354,24 +392,23 @@ def set_session_value(key: str, value) -> None:
 
 def clear_session_state() -> None:
     """Clear all session state (for logout)"""
-    for key in list(st.session_state.keys()):
-        del st.session_state[key]
+    st.session_state.clear()
 
 def calculate_kpi_trend(current: float, previous: float) -> Tuple[float, str]:
     """Calculate trend percentage and direction"""
-    if previous == 0:
+    if not previous:
         return 0.0, "neutral"
 
-    change = ((current - previous) / previous) * 100
+    change = (current - previous) * 100.0 / previous
 
     if change > 0:
         return change, "up"
-    elif change < 0:
-        return abs(change), "down"
-    else:
-        return 0.0, "neutral"
+    if change < 0:
+        return -change, "down"
+    return 0.0, "neutral"
 
-def paginate_data(data: List[Any], page: int, items_per_page: int) -> Tuple[List[Any], int]:
+def paginate_data(data: Union[List[Any], pd.DataFrame], page: int,
+                  items_per_page: int) -> Tuple[Union[List[Any], pd.DataFrame], int]:
     """Paginate data and return current page data and total pages"""
     total_items = len(data)
     total_pages = max(1, (total_items + items_per_page - 1) // items_per_page)
@@ -379,4 +416,8 @@ def paginate_data(data: List[Any], page: int, items_per_page: int) -> Tuple[List
     start_idx = (page - 1) * items_per_page
     end_idx = start_idx + items_per_page
 
-    return data[start_idx:end_idx], total_pages
\ No newline at end of file
+    # DataFrames are paged with a positional slice (a view, not a copy of the rows)
+    if isinstance(data, pd.DataFrame):
+        return data.iloc[start_idx:end_idx], total_pages
+
+    return data[start_idx:end_idx], total_pages